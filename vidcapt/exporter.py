@@ -1,33 +1,77 @@
-import re
+import functools
 import shutil
 
 from PySide6.QtCore import QObject, Signal, QProcess
 
+from vidcapt.timeutil import to_ms
+
+
+# Per-format encoder settings: quality name -> crf value, and the codec
+# arguments for a given crf
+_ENCODERS = {
+    "mp4": {
+        "crf": {"Maximum": 14, "High": 18, "Medium": 23, "Low": 28},
+        "args": lambda crf: [
+            "-c:v", "libx264",
+            "-crf", str(crf),
+            "-c:a", "aac",
+            "-b:a", "192k",
+        ],
+    },
+    "webm": {
+        "crf": {"Maximum": 15, "High": 24, "Medium": 30, "Low": 36},
+        "args": lambda crf: [
+            "-c:v", "libvpx-vp9",
+            "-crf", str(crf),
+            "-b:v", "0",
+            "-c:a", "libopus",
+            "-b:a", "128k",
+        ],
+    },
+}
 
-# Quality presets: (format, quality_name) -> crf value
-QUALITY_PRESETS = {
-    ("mp4", "Maximum"): 14,
-    ("mp4", "High"): 18,
-    ("mp4", "Medium"): 23,
-    ("mp4", "Low"): 28,
-    ("webm", "Maximum"): 15,
-    ("webm", "High"): 24,
-    ("webm", "Medium"): 30,
-    ("webm", "Low"): 36,
+# Codec arguments for every (format, quality) pair, built once
+_ARG_TAIL = {
+    (fmt, quality): tuple(enc["args"](crf))
+    for fmt, enc in _ENCODERS.items()
+    for quality, crf in enc["crf"].items()
 }
 
+# crf used when a quality name is not in a format's presets
+_DEFAULT_CRF = 23
+
+# Keys of interest in ffmpeg's -progress key=value output
+_OUT_TIME_KEY = b"out_time_us="
+_PROGRESS_END = b"progress=end"
+
+
+_ffmpeg_found = False
+
 
 def ffmpeg_available() -> bool:
-    """Check if ffmpeg is available on PATH."""
-    return shutil.which("ffmpeg") is not None
+    """Check if ffmpeg is available on PATH.
+
+    A positive result is cached for the process lifetime; while ffmpeg is
+    missing, every call looks again so installing it mid-session works.
+    """
+    global _ffmpeg_found
+    if not _ffmpeg_found:
+        _ffmpeg_found = shutil.which("ffmpeg") is not None
+    return _ffmpeg_found
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ms(ms: int) -> str:
+    """Format integer milliseconds to HH:MM:SS.mmm string."""
+    h, rem = divmod(ms, 3_600_000)
+    m, rem = divmod(rem, 60_000)
+    s, ms = divmod(rem, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
 def format_time(seconds: float) -> str:
     """Format seconds to HH:MM:SS.mmm string."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = seconds % 60
-    return f"{h:02d}:{m:02d}:{s:06.3f}"
+    return _fmt_ms(to_ms(seconds))
 
 
 class Exporter(QObject):
@@ -40,8 +84,10 @@ class Exporter(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._process = None
-        self._total_duration = 0.0
+        self._total_us = 0
         self._output_path = ""
+        self._buf = bytearray()
+        self._last_pct = -1
 
     @property
     def is_running(self) -> bool:
@@ -70,41 +116,36 @@ class Exporter(QObject):
             self.error.emit("Export already in progress.")
             return
 
-        self._total_duration = end - start
-        self._output_path = output_path
-
-        crf = QUALITY_PRESETS.get((fmt, quality), 23)
+        enc = _ENCODERS.get(fmt)
+        if enc is None:
+            self.error.emit(f"Unsupported export format: {fmt}")
+            return
 
         duration = end - start
+        self._total_us = int(duration * 1_000_000)
+        self._output_path = output_path
+        self._buf = bytearray()
+        self._last_pct = -1
+
+        tail = _ARG_TAIL.get((fmt, quality))
+        if tail is None:
+            tail = enc["args"](_DEFAULT_CRF)
 
         args = [
             "-y",
-            "-ss", format_time(start),
-            "-accurate_seek",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-progress", "pipe:1",
+            "-nostats",
+            "-ss", f"{start:.3f}",
             "-i", source,
-            "-t", format_time(duration),
+            "-t", f"{duration:.3f}",
+            *tail,
+            output_path,
         ]
 
-        if fmt == "mp4":
-            args += [
-                "-c:v", "libx264",
-                "-crf", str(crf),
-                "-c:a", "aac",
-                "-b:a", "192k",
-            ]
-        elif fmt == "webm":
-            args += [
-                "-c:v", "libvpx-vp9",
-                "-crf", str(crf),
-                "-b:v", "0",
-                "-c:a", "libopus",
-                "-b:a", "128k",
-            ]
-
-        args.append(output_path)
-
         self._process = QProcess(self)
-        self._process.setProcessChannelMode(QProcess.MergedChannels)
+        self._process.setProcessChannelMode(QProcess.SeparateChannels)
         self._process.readyReadStandardOutput.connect(self._on_output)
         self._process.finished.connect(self._on_finished)
         self._process.errorOccurred.connect(self._on_error)
@@ -117,22 +158,50 @@ class Exporter(QObject):
             self._process.kill()
 
     def _on_output(self):
-        """Parse ffmpeg output for progress."""
-        data = self._process.readAllStandardOutput().data().decode("utf-8", errors="replace")
-        # Look for time= in ffmpeg output
-        match = re.search(r"time=(\d+):(\d+):(\d+)\.(\d+)", data)
-        if match and self._total_duration > 0:
-            h, m, s, ms = match.groups()
-            current = int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 100
-            pct = min(100, int(current / self._total_duration * 100))
+        """Parse ffmpeg -progress key=value lines on stdout for progress."""
+        self._buf += self._process.readAllStandardOutput().data()
+        if b"\n" not in self._buf:
+            return
+        *lines, tail = self._buf.split(b"\n")
+        self._buf = bytearray(tail)
+        if self._total_us <= 0:
+            return
+        # Only the most recent progress block matters, so scan backwards
+        for line in reversed(lines):
+            if line.startswith(_OUT_TIME_KEY):
+                try:
+                    us = int(line[len(_OUT_TIME_KEY):])
+                except ValueError:
+                    # ffmpeg reports N/A until the first frame is written
+                    return
+                pct = max(0, min(100, us * 100 // self._total_us))
+                break
+            if line.startswith(_PROGRESS_END):
+                pct = 100
+                break
+        else:
+            return
+        if pct > self._last_pct:
+            self._last_pct = pct
             self.progress.emit(pct)
 
     def _on_finished(self, exit_code, exit_status):
         if exit_code == 0:
-            self.progress.emit(100)
+            # progress=end has usually reported 100 already
+            if self._last_pct < 100:
+                self._last_pct = 100
+                self.progress.emit(100)
             self.finished.emit(self._output_path)
         else:
-            self.error.emit(f"ffmpeg exited with code {exit_code}")
+            msg = f"ffmpeg exited with code {exit_code}"
+            # stderr carries only ffmpeg's error log (-loglevel error), so it is
+            # short enough to show in full; progress goes to stdout
+            detail = ""
+            if self._process is not None:
+                detail = self._process.readAllStandardError().data().decode("utf-8", errors="replace").strip()
+            if detail:
+                msg += f":\n\n{detail}"
+            self.error.emit(msg)
         self._process = None
 
     def _on_error(self, error):
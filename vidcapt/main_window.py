@@ -1,6 +1,6 @@
 import os
 
-from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QAction, QActionGroup, QKeySequence, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -52,12 +52,6 @@ class MainWindow(QMainWindow):
         self._build_shortcuts()
         self._connect_signals()
 
-        # Position polling timer (mpv property observers fire on the mpv thread,
-        # so we poll from the Qt side to keep UI updates safe)
-        self._poll_timer = QTimer(self)
-        self._poll_timer.setInterval(50)
-        self._poll_timer.timeout.connect(self._poll_position)
-
     # ── UI Construction ─────────────────────────────────────────────
 
     def _build_ui(self):
@@ -248,14 +242,19 @@ class MainWindow(QMainWindow):
         self._btn_preview.clicked.connect(self._preview_selection)
         self._btn_export.clicked.connect(self._export_clip)
 
-        # Player signals
-        self._player.duration_changed.connect(self._on_duration_changed)
-        self._player.file_loaded.connect(self._on_file_loaded)
+        # Player signals (mpv property observers and event callbacks fire on
+        # the mpv thread, so they are queued onto the GUI thread)
+        self._player.position_changed.connect(self._on_position_changed, Qt.QueuedConnection)
+        self._player.duration_changed.connect(self._on_duration_changed, Qt.QueuedConnection)
+        self._player.file_loaded.connect(self._on_file_loaded, Qt.QueuedConnection)
+        self._player.playback_state_changed.connect(
+            self._on_playback_state_changed, Qt.QueuedConnection
+        )
 
-        # Timeline signals
-        self._timeline.seek_requested.connect(self._on_seek_requested)
-        self._timeline.in_point_changed.connect(self._on_in_point_changed)
-        self._timeline.out_point_changed.connect(self._on_out_point_changed)
+        # Timeline signals (emitted from mouse events on the GUI thread)
+        self._timeline.seek_requested.connect(self._on_seek_requested, Qt.DirectConnection)
+        self._timeline.in_point_changed.connect(self._on_in_point_changed, Qt.DirectConnection)
+        self._timeline.out_point_changed.connect(self._on_out_point_changed, Qt.DirectConnection)
 
         # Exporter signals
         self._exporter.progress.connect(self._on_export_progress)
@@ -264,20 +263,28 @@ class MainWindow(QMainWindow):
 
     # ── Slots ───────────────────────────────────────────────────────
 
-    def _poll_position(self):
-        """Poll mpv position and update UI."""
-        pos = self._player.position
-        dur = self._player.duration
+    @Slot(float)
+    def _on_position_changed(self, pos: float):
         self._timeline.position = pos
-        self._lbl_time.setText(f"{format_time(pos)} / {format_time(dur)}")
+        self._update_time_label(pos)
 
         # Auto-pause at out-point during preview
         if self._previewing and pos >= self._timeline.out_point:
             self._previewing = False
             self._player.pause()
 
-        # Update play button text
-        self._btn_play.setText("❚❚" if not self._player.paused else "▶")
+    @Slot(bool)
+    def _on_playback_state_changed(self, paused: bool):
+        # mpv reports the idle player's pause state as soon as the observer
+        # is registered; leave the button alone until there is a file
+        if not self._source_path:
+            return
+        self._btn_play.setText("❚❚" if not paused else "▶")
+
+    def _update_time_label(self, pos: float):
+        # The timeline's duration is only written on the GUI thread
+        dur = self._timeline.duration
+        self._lbl_time.setText(f"{format_time(pos)} / {format_time(dur)}")
 
     def _toggle_play(self):
         self._previewing = False
@@ -290,31 +297,36 @@ class MainWindow(QMainWindow):
     def _set_in_point(self):
         t = self._player.position
         self._timeline.in_point = t
-        self._edit_start.setText(format_time(t))
-        self._update_clip_duration()
+        self._update_clip_fields()
 
     @Slot()
     def _set_out_point(self):
         t = self._player.position
         self._timeline.out_point = t
-        self._edit_end.setText(format_time(t))
-        self._update_clip_duration()
-
-    def _update_clip_duration(self):
-        dur = self._timeline.out_point - self._timeline.in_point
-        self._lbl_duration.setText(f"Duration: {format_time(max(0, dur))}")
+        self._update_clip_fields()
+
+    def _update_clip_fields(self):
+        """Refresh the start/end/duration fields from the timeline."""
+        in_pt = self._timeline.in_point
+        out_pt = self._timeline.out_point
+        for edit, t in ((self._edit_start, in_pt), (self._edit_end, out_pt)):
+            text = format_time(t)
+            # Unlike QLabel, QLineEdit doesn't skip identical text
+            if edit.text() != text:
+                edit.setText(text)
+        self._lbl_duration.setText(f"Duration: {format_time(max(0, out_pt - in_pt))}")
 
     @Slot(float)
     def _on_duration_changed(self, duration: float):
         self._timeline.duration = duration
         self._timeline.out_point = duration
-        self._edit_end.setText(format_time(duration))
-        self._update_clip_duration()
+        self._update_clip_fields()
+        self._update_time_label(self._player.position)
 
     @Slot()
     def _on_file_loaded(self):
         self._btn_export.setEnabled(True)
-        self._poll_timer.start()
+        self._btn_play.setText("❚❚" if not self._player.paused else "▶")
         self._populate_track_menus()
         self._status.showMessage(f"Loaded: {os.path.basename(self._source_path)}")
 
@@ -324,13 +336,11 @@ class MainWindow(QMainWindow):
 
     @Slot(float)
     def _on_in_point_changed(self, t: float):
-        self._edit_start.setText(format_time(t))
-        self._update_clip_duration()
+        self._update_clip_fields()
 
     @Slot(float)
     def _on_out_point_changed(self, t: float):
-        self._edit_end.setText(format_time(t))
-        self._update_clip_duration()
+        self._update_clip_fields()
 
     @Slot()
     def _preview_selection(self):
@@ -481,7 +491,7 @@ class MainWindow(QMainWindow):
         self._source_path = path
         self._player.load(path)
         self._timeline.in_point = 0.0
-        self._edit_start.setText(format_time(0))
+        self._update_clip_fields()
         self._status.showMessage(f"Loading: {os.path.basename(path)}")
 
     # ── Drag & Drop ────────────────────────────────────────────────
@@ -500,7 +510,6 @@ class MainWindow(QMainWindow):
     # ── Close ──────────────────────────────────────────────────────
 
     def closeEvent(self, event):
-        self._poll_timer.stop()
         if self._exporter.is_running:
             self._exporter.cancel()
         self._player.closeEvent(event)
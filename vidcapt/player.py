@@ -5,6 +5,8 @@ import mpv
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtWidgets import QWidget
 
+from vidcapt.timeutil import to_ms
+
 
 class MpvPlayer(QWidget):
     """Embeds an mpv player into a Qt widget."""
@@ -12,6 +14,7 @@ class MpvPlayer(QWidget):
     position_changed = Signal(float)
     duration_changed = Signal(float)
     file_loaded = Signal()
+    playback_state_changed = Signal(bool)  # True when paused
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -22,6 +25,8 @@ class MpvPlayer(QWidget):
 
         self._duration = 0.0
         self._position = 0.0
+        self._position_ms = 0
+        self._paused = None  # unknown until mpv's first pause callback
         self._creating_player = False
         self._mpv = None
 
@@ -43,13 +48,17 @@ class MpvPlayer(QWidget):
             osc="no",
             input_default_bindings="no",
             input_vo_keyboard="no",
-            log_handler=lambda *a: None,
         )
 
         @self._mpv.property_observer("time-pos")
         def on_time_pos(_name, value):
-            if value is not None:
-                self._position = value
+            if value is None:
+                return
+            self._position = value
+            # Only notify when the millisecond the UI displays changes
+            ms = to_ms(value)
+            if ms != self._position_ms:
+                self._position_ms = ms
                 self.position_changed.emit(value)
 
         @self._mpv.property_observer("duration")
@@ -58,6 +67,12 @@ class MpvPlayer(QWidget):
                 self._duration = value
                 self.duration_changed.emit(value)
 
+        @self._mpv.property_observer("pause")
+        def on_pause(_name, value):
+            if value is not None:
+                self._paused = bool(value)
+                self.playback_state_changed.emit(self._paused)
+
         @self._mpv.event_callback("file-loaded")
         def on_file_loaded(event):
             self.file_loaded.emit()
@@ -72,18 +87,18 @@ class MpvPlayer(QWidget):
 
     def play(self):
         """Resume playback."""
-        if self._mpv and self._mpv.pause:
+        if self._mpv:
             self._mpv.pause = False
 
     def pause(self):
         """Pause playback."""
-        if self._mpv and not self._mpv.pause:
+        if self._mpv:
             self._mpv.pause = True
 
     def toggle_pause(self):
         """Toggle play/pause."""
         if self._mpv:
-            self._mpv.pause = not self._mpv.pause
+            self._mpv.cycle("pause")
 
     def seek(self, seconds: float, reference: str = "relative"):
         """Seek by a relative or absolute amount.
@@ -115,9 +130,9 @@ class MpvPlayer(QWidget):
 
     @property
     def paused(self) -> bool:
-        if self._mpv:
-            return self._mpv.pause
-        return True
+        if self._paused is None:
+            return True
+        return self._paused
 
     def get_tracks(self, track_type=None):
         """Return list of track dicts from mpv.
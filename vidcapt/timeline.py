@@ -1,5 +1,5 @@
-from PySide6.QtCore import Qt, Signal, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QMouseEvent, QPaintEvent
+from PySide6.QtCore import Qt, Signal, QPointF, QRect, QRectF, QTimer
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QMouseEvent, QPaintEvent, QResizeEvent
 from PySide6.QtWidgets import QWidget
 
 
@@ -15,6 +15,8 @@ class Timeline(QWidget):
     HANDLE_HEIGHT = 30
     MARGIN_X = 12
     MARGIN_Y = 10
+    HIT_EXPAND = 4  # extra px around handles for easier grabbing
+    DRAG_UPDATE_INTERVAL = 16  # ms, caps mouse-driven repaints/seeks at ~60 Hz
 
     COLOR_TRACK = QColor(60, 60, 60)
     COLOR_SELECTION = QColor(40, 120, 200, 120)
@@ -23,11 +25,17 @@ class Timeline(QWidget):
     COLOR_OUT_HANDLE = QColor(200, 60, 30)
     COLOR_HANDLE_HOVER = QColor(255, 255, 100)
 
+    # Built once and shared so painting doesn't allocate per frame
+    BRUSH_SELECTION = QBrush(COLOR_SELECTION)
+    PEN_PLAYHEAD = QPen(COLOR_PLAYHEAD, 2)
+    PEN_HANDLE = QPen(QColor(255, 255, 255, 80), 1)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(self.HANDLE_HEIGHT + self.MARGIN_Y * 2)
         self.setFixedHeight(self.HANDLE_HEIGHT + self.MARGIN_Y * 2 + 10)
-        self.setCursor(Qt.PointingHandCursor)
+        self._cursor_shape = Qt.PointingHandCursor
+        self.setCursor(self._cursor_shape)
 
         self._duration = 0.0
         self._position = 0.0
@@ -37,6 +45,35 @@ class Timeline(QWidget):
         self._dragging = None  # None, 'in', 'out', 'seek'
         self._hover = None  # None, 'in', 'out'
 
+        # Mouse moves arrive far faster than the display refreshes, so
+        # repaints and seeks from them are coalesced onto a single-shot timer
+        self._pending_seek = None
+        self._seek_target = None  # last seek emitted or pending
+        self._update_trigger = QTimer(self)
+        self._update_trigger.setSingleShot(True)
+        self._update_trigger.setInterval(self.DRAG_UPDATE_INTERVAL)
+        self._update_trigger.timeout.connect(self._flush_mouse_updates)
+
+        # Geometry cached per resize / duration change for the paint and
+        # mouse paths
+        self._has_duration = False
+        self._inv_duration = 0.0
+        self._in_x = 0
+        self._out_x = 0
+        self._playhead_x = 0  # pixel column the playhead is drawn at
+        self._update_geometry()
+
+        # Antialiased rounded shapes are pre-rendered once per resize
+        self._track_pixmap: QPixmap | None = None
+        self._in_pixmap: QPixmap | None = None
+        self._out_pixmap: QPixmap | None = None
+        self._hover_pixmap: QPixmap | None = None
+        self._update_pixmaps()
+
+        # Backing store for everything except the playhead
+        self._background: QPixmap | None = None
+        self._background_dirty = True
+
         self.setMouseTracking(True)
 
     @property
@@ -45,8 +82,13 @@ class Timeline(QWidget):
 
     @duration.setter
     def duration(self, value: float):
-        self._duration = max(0.0, value)
+        self._duration = value if value > 0.0 else 0.0
+        self._has_duration = self._duration > 0.0
+        self._inv_duration = 1.0 / self._duration if self._has_duration else 0.0
         self._out_point = self._duration
+        self._update_handle_x()
+        self._playhead_x = int(self._time_to_x(self._position))
+        self._background_dirty = True
         self.update()
 
     @property
@@ -55,8 +97,21 @@ class Timeline(QWidget):
 
     @position.setter
     def position(self, value: float):
-        self._position = max(0.0, min(value, self._duration))
-        self.update()
+        # Comparison chains clamp without the min()/max() call overhead;
+        # upper bound first, so the lower bound wins like max(lo, min(v, hi))
+        if value > self._duration:
+            value = self._duration
+        if value < 0.0:
+            value = 0.0
+        self._position = value
+        new_x = int(self._time_to_x(self._position))
+        # Nothing to repaint until the playhead reaches another pixel column
+        if new_x == self._playhead_x:
+            return
+        old_x = self._playhead_x
+        self._playhead_x = new_x
+        # Only the playhead moves, so repaint just its old and new columns
+        self.update(self._playhead_rect(old_x).united(self._playhead_rect(new_x)))
 
     @property
     def in_point(self) -> float:
@@ -64,7 +119,15 @@ class Timeline(QWidget):
 
     @in_point.setter
     def in_point(self, value: float):
-        self._in_point = max(0.0, min(value, self._out_point))
+        if value > self._out_point:
+            value = self._out_point
+        if value < 0.0:
+            value = 0.0
+        if value == self._in_point:
+            return
+        self._in_point = value
+        self._update_handle_x()
+        self._background_dirty = True
         self.update()
 
     @property
@@ -73,134 +136,251 @@ class Timeline(QWidget):
 
     @out_point.setter
     def out_point(self, value: float):
-        self._out_point = max(self._in_point, min(value, self._duration))
+        if value > self._duration:
+            value = self._duration
+        if value < self._in_point:
+            value = self._in_point
+        if value == self._out_point:
+            return
+        self._out_point = value
+        self._update_handle_x()
+        self._background_dirty = True
         self.update()
 
-    def _track_rect(self) -> QRectF:
-        """Return the rectangle for the track bar."""
-        y = (self.height() - self.TRACK_HEIGHT) / 2
-        return QRectF(self.MARGIN_X, y, self.width() - 2 * self.MARGIN_X, self.TRACK_HEIGHT)
+    def _update_geometry(self):
+        """Recompute the cached track and handle geometry for the current size."""
+        self._track_left = float(self.MARGIN_X)
+        self._track_width = float(self.width() - 2 * self.MARGIN_X)
+        self._inv_track_width = 1.0 / self._track_width if self._track_width > 0 else 0.0
+        self._track_y = (self.height() - self.TRACK_HEIGHT) / 2
+        self._handle_y = (self.height() - self.HANDLE_HEIGHT) / 2
+        # Playhead line ends, extending 4 px past the track on each side
+        self._playhead_top = int(self._track_y) - 4
+        self._playhead_bottom = int(self._track_y) + self.TRACK_HEIGHT + 4
+        self._update_handle_x()
+        self._playhead_x = int(self._time_to_x(self._position))
+
+    def _update_handle_x(self):
+        """Recompute the cached pixel columns of the in/out handles."""
+        # Snapped to integers so the selection edges and handle pixmaps line up
+        self._in_x = int(self._time_to_x(self._in_point))
+        self._out_x = int(self._time_to_x(self._out_point))
+
+    def _render_rounded(self, width: float, height: float, color: QColor,
+                        radius: float, pen: QPen | None = None) -> QPixmap:
+        """Pre-render a filled rounded rect into a transparent pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        rect = QRectF(0, 0, width, height)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        if pen is None:
+            painter.setPen(Qt.NoPen)
+        else:
+            painter.setPen(pen)
+            # Keep the outline inside the pixmap
+            rect.adjust(0.5, 0.5, -0.5, -0.5)
+        painter.setBrush(QBrush(color))
+        painter.drawRoundedRect(rect, radius, radius)
+        painter.end()
+        return pixmap
+
+    def _update_pixmaps(self):
+        """Rebuild the cached track and handle pixmaps."""
+        self._pixmap_dpr = self.devicePixelRatioF()
+        self._track_pixmap = self._render_rounded(
+            self._track_width, self.TRACK_HEIGHT, self.COLOR_TRACK, 3,
+        )
+        w, h = self.HANDLE_WIDTH, self.HANDLE_HEIGHT
+        self._in_pixmap = self._render_rounded(w, h, self.COLOR_IN_HANDLE, 2, self.PEN_HANDLE)
+        self._out_pixmap = self._render_rounded(w, h, self.COLOR_OUT_HANDLE, 2, self.PEN_HANDLE)
+        self._hover_pixmap = self._render_rounded(w, h, self.COLOR_HANDLE_HOVER, 2, self.PEN_HANDLE)
+
+    def resizeEvent(self, event: QResizeEvent):
+        self._update_geometry()
+        self._update_pixmaps()
+        self._background_dirty = True
+        super().resizeEvent(event)
 
     def _time_to_x(self, t: float) -> float:
         """Convert a time value to an x pixel position."""
-        track = self._track_rect()
-        if self._duration <= 0:
-            return track.left()
-        ratio = t / self._duration
-        return track.left() + ratio * track.width()
+        return self._track_left + t * self._track_width * self._inv_duration
 
     def _x_to_time(self, x: float) -> float:
         """Convert an x pixel position to a time value."""
-        track = self._track_rect()
-        if track.width() <= 0:
-            return 0.0
-        ratio = (x - track.left()) / track.width()
-        ratio = max(0.0, min(1.0, ratio))
+        ratio = (x - self._track_left) * self._inv_track_width
+        ratio = 0.0 if ratio < 0.0 else (1.0 if ratio > 1.0 else ratio)
         return ratio * self._duration
 
-    def _in_handle_rect(self) -> QRectF:
-        x = self._time_to_x(self._in_point)
-        y = (self.height() - self.HANDLE_HEIGHT) / 2
-        return QRectF(x - self.HANDLE_WIDTH, y, self.HANDLE_WIDTH, self.HANDLE_HEIGHT)
-
-    def _out_handle_rect(self) -> QRectF:
-        x = self._time_to_x(self._out_point)
-        y = (self.height() - self.HANDLE_HEIGHT) / 2
-        return QRectF(x, y, self.HANDLE_WIDTH, self.HANDLE_HEIGHT)
-
     def _hit_test(self, pos) -> str | None:
         """Return 'in', 'out', or None based on mouse position."""
-        # Expand hit area slightly for easier grabbing
-        expand = 4
-        in_rect = self._in_handle_rect().adjusted(-expand, -expand, expand, expand)
-        out_rect = self._out_handle_rect().adjusted(-expand, -expand, expand, expand)
-        if in_rect.contains(pos):
+        expand = self.HIT_EXPAND
+        y = pos.y()
+        if not (self._handle_y - expand <= y <= self._handle_y + self.HANDLE_HEIGHT + expand):
+            return None
+        x = pos.x()
+        # The in handle sits left of its x, the out handle right of its x
+        if self._in_x - self.HANDLE_WIDTH - expand <= x <= self._in_x + expand:
             return "in"
-        if out_rect.contains(pos):
+        if self._out_x - expand <= x <= self._out_x + self.HANDLE_WIDTH + expand:
             return "out"
         return None
 
-    def paintEvent(self, event: QPaintEvent):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        track = self._track_rect()
+    def _playhead_rect(self, x: float) -> QRect:
+        """Return the area covered by the playhead line drawn at x."""
+        top = self._playhead_top
+        return QRect(int(x) - 2, top - 1, 5, self._playhead_bottom - top + 3)
+
+    def _render_background(self):
+        """Compose the track, selection and handles into the backing pixmap."""
+        dpr = self.devicePixelRatioF()
+        # Moving to a screen with another scale factor needn't resize us,
+        # so re-render the shape pixmaps whenever the DPR has changed
+        if dpr != self._pixmap_dpr:
+            self._update_pixmaps()
+        size = self.size() * dpr
+        # Reuse the pixmap between recomposes unless the size changed
+        if self._background is None or self._background.size() != size:
+            self._background = QPixmap(size)
+            self._background.setDevicePixelRatio(dpr)
+        self._background.fill(Qt.transparent)
+        self._background_dirty = False
+
+        # No antialiasing: the rounded shapes come pre-rendered from pixmaps
+        # and the rest is axis-aligned on integer coordinates
+        painter = QPainter(self._background)
+
+        x_in = self._in_x
+        x_out = self._out_x
+        hover = self._hover
+        handle_w = self.HANDLE_WIDTH
+        handle_y = int(self._handle_y)
 
         # Draw track background
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(self.COLOR_TRACK))
-        painter.drawRoundedRect(track, 3, 3)
+        painter.drawPixmap(QPointF(self._track_left, self._track_y), self._track_pixmap)
 
         # Draw selected region
-        if self._duration > 0:
-            x_in = self._time_to_x(self._in_point)
-            x_out = self._time_to_x(self._out_point)
-            sel_rect = QRectF(x_in, track.top(), x_out - x_in, track.height())
-            painter.setBrush(QBrush(self.COLOR_SELECTION))
-            painter.drawRect(sel_rect)
+        if self._has_duration:
+            sel_rect = QRect(x_in, int(self._track_y), x_out - x_in, self.TRACK_HEIGHT)
+            painter.fillRect(sel_rect, self.BRUSH_SELECTION)
 
         # Draw in handle
-        in_rect = self._in_handle_rect()
-        color = self.COLOR_HANDLE_HOVER if self._hover == "in" else self.COLOR_IN_HANDLE
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(QColor(255, 255, 255, 80), 1))
-        painter.drawRoundedRect(in_rect, 2, 2)
+        pixmap = self._hover_pixmap if hover == "in" else self._in_pixmap
+        painter.drawPixmap(x_in - handle_w, handle_y, pixmap)
 
         # Draw out handle
-        out_rect = self._out_handle_rect()
-        color = self.COLOR_HANDLE_HOVER if self._hover == "out" else self.COLOR_OUT_HANDLE
-        painter.setBrush(QBrush(color))
-        painter.drawRoundedRect(out_rect, 2, 2)
+        pixmap = self._hover_pixmap if hover == "out" else self._out_pixmap
+        painter.drawPixmap(x_out, handle_y, pixmap)
+
+        painter.end()
+
+    def paintEvent(self, event: QPaintEvent):
+        # Static content is only recomposed when it changes; during playback
+        # a paint is a blit (clipped by Qt to the dirty area) plus one line
+        if self._background_dirty or self.devicePixelRatioF() != self._pixmap_dpr:
+            self._render_background()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
 
         # Draw playhead
-        if self._duration > 0:
-            px = self._time_to_x(self._position)
-            pen = QPen(self.COLOR_PLAYHEAD, 2)
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawLine(int(px), int(track.top() - 4), int(px), int(track.bottom() + 4))
+        if self._has_duration:
+            x_pos = self._playhead_x
+            if event.rect().intersects(self._playhead_rect(x_pos)):
+                painter.setPen(self.PEN_PLAYHEAD)
+                painter.drawLine(x_pos, self._playhead_top, x_pos, self._playhead_bottom)
 
         painter.end()
 
+    def _schedule_mouse_update(self):
+        if not self._update_trigger.isActive():
+            self._update_trigger.start()
+
+    def _flush_mouse_updates(self):
+        """Emit the latest coalesced seek, or repaint for handle/hover changes."""
+        if self._pending_seek is not None:
+            t = self._pending_seek
+            self._pending_seek = None
+            self.seek_requested.emit(t)
+        else:
+            self.update()
+
     def mousePressEvent(self, event: QMouseEvent):
-        if event.button() != Qt.LeftButton or self._duration <= 0:
+        if event.button() != Qt.LeftButton or not self._has_duration:
             return
 
-        hit = self._hit_test(event.position())
+        pos = event.position()
+        hit = self._hit_test(pos)
         if hit:
             self._dragging = hit
         else:
             self._dragging = "seek"
-            t = self._x_to_time(event.position().x())
+            t = self._x_to_time(pos.x())
+            self._seek_target = t
             self.seek_requested.emit(t)
 
     def mouseMoveEvent(self, event: QMouseEvent):
-        if self._duration <= 0:
+        if not self._has_duration:
             return
 
-        if self._dragging == "in":
-            t = self._x_to_time(event.position().x())
-            t = max(0.0, min(t, self._out_point))
-            self._in_point = t
-            self.in_point_changed.emit(t)
-            self.update()
-        elif self._dragging == "out":
-            t = self._x_to_time(event.position().x())
-            t = max(self._in_point, min(t, self._duration))
-            self._out_point = t
-            self.out_point_changed.emit(t)
-            self.update()
-        elif self._dragging == "seek":
-            t = self._x_to_time(event.position().x())
-            self.seek_requested.emit(t)
+        pos = event.position()
+        x = pos.x()
+        dragging = self._dragging
+        if dragging == "in":
+            t = self._x_to_time(x)
+            if t > self._out_point:
+                t = self._out_point
+            if t < 0.0:
+                t = 0.0
+            # Dragging past a clamp boundary keeps producing the same value
+            if t != self._in_point:
+                self._in_point = t
+                self._update_handle_x()
+                self._background_dirty = True
+                self.in_point_changed.emit(t)
+                self._schedule_mouse_update()
+        elif dragging == "out":
+            t = self._x_to_time(x)
+            if t > self._duration:
+                t = self._duration
+            if t < self._in_point:
+                t = self._in_point
+            if t != self._out_point:
+                self._out_point = t
+                self._update_handle_x()
+                self._background_dirty = True
+                self.out_point_changed.emit(t)
+                self._schedule_mouse_update()
+        elif dragging == "seek":
+            t = self._x_to_time(x)
+            if t != self._seek_target:
+                self._seek_target = t
+                self._pending_seek = t
+                self._schedule_mouse_update()
         else:
-            # Hover detection
-            hit = self._hit_test(event.position())
+            # Hover detection, skipping the hit test when the cursor is
+            # outside the span covered by both handles
+            reach = self.HANDLE_WIDTH + self.HIT_EXPAND
+            if self._in_x - reach <= x <= self._out_x + reach:
+                hit = self._hit_test(pos)
+            else:
+                hit = None
             if hit != self._hover:
                 self._hover = hit
-                self.setCursor(Qt.SizeHorCursor if hit else Qt.PointingHandCursor)
-                self.update()
+                self._background_dirty = True
+                # Moving straight from one handle to the other keeps the shape
+                shape = Qt.SizeHorCursor if hit else Qt.PointingHandCursor
+                if shape != self._cursor_shape:
+                    self._cursor_shape = shape
+                    self.setCursor(shape)
+                self._schedule_mouse_update()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
             self._dragging = None
+            # Deliver the final drag position without waiting for the timer
+            if self._update_trigger.isActive():
+                self._update_trigger.stop()
+                self._flush_mouse_updates()
@@ -0,0 +1,7 @@
+def to_ms(seconds: float) -> int:
+    """Round seconds to integer milliseconds.
+
+    This is the one place float seconds from mpv are rounded; display
+    formatting and position change detection both go through it.
+    """
+    return int(round(seconds * 1000))